@@ -6,18 +6,8 @@ cli.py
 from pathlib import Path
 
 import typer
-from rich.console import Console
-from rich.panel import Panel
-from rich.prompt import Confirm, Prompt
 
 from . import __version__
-from .generator import (
-    ProjectConfig,
-    write_publish_workflow,
-    write_pyproject,
-    write_style_yapf,
-)
-from .presets import PRESETS
 
 
 app = typer.Typer(
@@ -27,7 +17,6 @@ app = typer.Typer(
     rich_markup_mode = "rich",
     no_args_is_help = True,
 )
-console = Console()
 
 
 def version_callback(value: bool) -> None:
@@ -35,12 +24,25 @@ def version_callback(value: bool) -> None:
     Display version and exit.
     """
     if value:
-        console.print(
+        from rich.console import Console
+
+        Console().print(
             f"[bold cyan]pyproject-setup[/bold cyan] v{__version__}"
         )
         raise typer.Exit()
 
 
+def _is_explicit(ctx: typer.Context, param: str) -> bool:
+    """
+    Check whether a parameter was supplied rather than left at its default.
+    """
+    source = ctx.get_parameter_source(param)
+    return source is not None and source.name not in {
+        "DEFAULT",
+        "DEFAULT_MAP",
+    }
+
+
 @app.callback()
 def main(
     version: bool | None = typer.Option(
@@ -60,6 +62,7 @@ def main(
 
 @app.command()
 def init(
+    ctx: typer.Context,
     name: str | None = typer.Option(
         None,
         "--name",
@@ -127,6 +130,19 @@ def init(
 
     Run interactively or pass flags for automation.
     """
+    from rich.console import Console, Group
+    from rich.panel import Panel
+    from rich.prompt import Confirm, Prompt
+    from rich.text import Text
+
+    from .generator import ProjectConfig, write_all
+    from .presets import (
+        PRESETS,
+        PRESET_CHOICES,
+        PRESET_MENU_LINES,
+    )
+
+    console = Console()
     console.print()
     console.print(
         Panel(
@@ -148,61 +164,61 @@ def init(
         raise typer.Exit(1)
 
     if name is None:
+        default_name = output.resolve().name
         name = Prompt.ask(
             "[bold]Project name[/bold]",
-            default = output.resolve().name
+            default = default_name
         )
 
     if description is None:
         description = Prompt.ask("[bold]Description[/bold]", default = "")
 
     if preset is None:
-        preset_choices = list(PRESETS.keys())
         console.print("\n[bold]Available presets:[/bold]")
-        for i, p in enumerate(preset_choices, 1):
-            preset_obj = PRESETS[p]
-            console.print(
-                f"  [cyan]{i}[/cyan]. {p} - {preset_obj.description}"
-            )
+        console.print("\n".join(PRESET_MENU_LINES))
 
         while True:
             choice = Prompt.ask(
                 "\n[bold]Select preset[/bold]",
                 default = "1",
             )
-            try:
+            if choice.isdecimal():
                 idx = int(choice) - 1
-                if 0 <= idx < len(preset_choices):
-                    preset = preset_choices[idx]
-                    break
-            except ValueError:
-                if choice in preset_choices:
-                    preset = choice
+                if 0 <= idx < len(PRESET_CHOICES):
+                    preset = PRESET_CHOICES[idx]
                     break
+            elif choice in PRESETS:
+                preset = choice
+                break
             console.print("[red]Invalid choice. Try again.[/red]")
 
     if preset not in PRESETS:
         console.print(f"[red]Unknown preset: {preset}[/red]")
         raise typer.Exit(1)
 
-    python_ver = Prompt.ask(
-        "[bold]Python version[/bold]",
-        default = python
-    )
-    pkg_path = Prompt.ask(
-        "[bold]Package path[/bold]",
-        default = package_path
-    )
+    python_ver = python
+    if not _is_explicit(ctx, "python"):
+        python_ver = Prompt.ask(
+            "[bold]Python version[/bold]",
+            default = python
+        )
+
+    pkg_path = package_path
+    if not _is_explicit(ctx, "package_path"):
+        pkg_path = Prompt.ask(
+            "[bold]Package path[/bold]",
+            default = package_path
+        )
 
     add_workflow = workflow
-    if workflow:
+    if workflow and not _is_explicit(ctx, "workflow"):
         add_workflow = Confirm.ask(
             "[bold]Add PyPI publish workflow?[/bold]",
             default = True
         )
 
     add_yapf = yapf
-    if not yapf:
+    if not yapf and not _is_explicit(ctx, "yapf"):
         add_yapf = Confirm.ask(
             "[bold]Add .style.yapf config?[/bold]",
             default = False
@@ -238,29 +254,29 @@ def init(
         homepage = home,
     )
 
-    with console.status(
-            "[bold green]Generating pyproject.toml...[/bold green]"):
-        pyproject_file = write_pyproject(config, output)
-        console.print(f"[green]Created[/green] {pyproject_file}")
-
-        if add_workflow:
-            workflow_file = write_publish_workflow(name, output)
-            console.print(f"[green]Created[/green] {workflow_file}")
-
-        if add_yapf:
-            yapf_file = write_style_yapf(output)
-            console.print(f"[green]Created[/green] {yapf_file}")
+    created = write_all(
+        config,
+        output,
+        add_workflow = add_workflow,
+        add_yapf = add_yapf,
+    )
 
-    console.print()
     console.print(
-        Panel(
-            f"[bold green]Done![/bold green] Project [cyan]{name}[/cyan] initialized.\n\n"
-            f"Next steps:\n"
-            f"  1. Create [cyan]{pkg_path}/[/cyan] directory\n"
-            f"  2. [dim]pip install -e \".[dev]\"[/dim]\n"
-            f"  3. Start coding!",
-            title = "Success",
-            border_style = "green",
+        Group(
+            *(
+                Text.assemble(("Created", "green"),
+                              f" {path}") for path in created
+            ),
+            Text(),
+            Panel(
+                f"[bold green]Done![/bold green] Project [cyan]{name}[/cyan] initialized.\n\n"
+                f"Next steps:\n"
+                f"  1. Create [cyan]{pkg_path}/[/cyan] directory\n"
+                f"  2. [dim]pip install -e \".[dev]\"[/dim]\n"
+                f"  3. Start coding!",
+                title = "Success",
+                border_style = "green",
+            ),
         )
     )
 
@@ -3,12 +3,12 @@ AngelaMos | 2025
 generator.py
 """
 
-from typing import Any
+from io import BytesIO
 from pathlib import Path
+from functools import lru_cache
+from typing import Any, BinaryIO
 from dataclasses import dataclass
 
-import tomli_w
-
 from .presets import (
     PRESETS,
     Preset,
@@ -22,7 +22,7 @@ from .presets import (
 )
 
 
-@dataclass
+@dataclass(slots = True)
 class ProjectConfig:
     """
     User provided project configuration
@@ -127,10 +127,17 @@ split_penalty_bitwise_operator = 290
 split_penalty_logical_operator = 0
 '''
 
+_STYLE_YAPF_BYTES = STYLE_YAPF.encode("utf-8")
 
-def build_pyproject(config: ProjectConfig) -> dict[str, Any]:
+_PUB_PREFIX, _PUB_SUFFIX = (
+    part.encode("utf-8")
+    for part in PUBLISH_WORKFLOW.split("$PROJECT_NAME", 1)
+)
+
+
+def _build_project(config: ProjectConfig) -> dict[str, Any]:
     """
-    Build complete pyproject.toml structure from config
+    Build the [project] table from config
     """
     preset: Preset = PRESETS[config.preset]
 
@@ -140,12 +147,12 @@ def build_pyproject(config: ProjectConfig) -> dict[str, Any]:
                       "version": config.version,
                       "description": config.description,
                       "requires-python": config.python_version,
-                      "dependencies": preset.dependencies.copy(),
+                      "dependencies": preset.dependencies,
                   }
 
     if preset.dev_dependencies:
         project["optional-dependencies"] = {
-            "dev": preset.dev_dependencies.copy()
+            "dev": preset.dev_dependencies
         }
 
     urls: dict[str, str] = {}
@@ -166,60 +173,103 @@ def build_pyproject(config: ProjectConfig) -> dict[str, Any]:
             }
         ]
 
-    pyproject: dict[str,
-                    Any] = {
-                        "project": project,
-                        "build-system": {
-                            "requires": ["hatchling"],
-                            "build-backend": "hatchling.build",
-                        },
-                        "tool": {
-                            "hatch": {
-                                "build": {
-                                    "targets": {
-                                        "wheel": {
-                                            "packages":
-                                            [config.package_path]
-                                        }
-                                    }
-                                }
-                            },
-                            "ruff":
-                            get_ruff_config(config.package_path),
-                            "mypy":
-                            get_mypy_config(config.package_path),
-                            "pydantic-mypy":
-                            get_pydantic_mypy_config(),
-                            "pylint":
-                            get_pylint_config(config.package_path),
-                            "pytest": {
-                                "ini_options": get_pytest_config()
-                            },
-                            "coverage":
-                            get_coverage_config(config.package_path),
-                            "ty":
-                            get_ty_config(config.package_path),
-                        },
-                    }
-
     if preset.entry_point:
-        pyproject["project"]["scripts"] = {
+        project["scripts"] = {
             config.name:
             f"{config.package_path.replace('/', '.')}.{preset.entry_point}"
         }
 
-    return pyproject
+    return project
+
+
+def _build_static_tables(package_path: str) -> dict[str, Any]:
+    """
+    Build the [build-system] and [tool] tables for a package path
+    """
+    return {
+        "build-system": {
+            "requires": ["hatchling"],
+            "build-backend": "hatchling.build",
+        },
+        "tool": {
+            "hatch": {
+                "build": {
+                    "targets": {
+                        "wheel": {
+                            "packages": [package_path]
+                        }
+                    }
+                }
+            },
+            "ruff": get_ruff_config(package_path),
+            "mypy": get_mypy_config(package_path),
+            "pydantic-mypy": get_pydantic_mypy_config(),
+            "pylint": get_pylint_config(package_path),
+            "pytest": {
+                "ini_options": get_pytest_config()
+            },
+            "coverage": get_coverage_config(package_path),
+            "ty": get_ty_config(package_path),
+        },
+    }
+
+
+@lru_cache(maxsize = 4)
+def _dump_static_tables(package_path: str) -> bytes:
+    """
+    Serialize and encode the static tables for a package path once per
+    process
+    """
+    import tomli_w
+
+    return tomli_w.dumps(_build_static_tables(package_path)
+                         ).encode("utf-8")
+
+
+def build_pyproject(config: ProjectConfig) -> dict[str, Any]:
+    """
+    Build complete pyproject.toml structure from config
+    """
+    return {
+        "project": _build_project(config),
+        **_build_static_tables(config.package_path),
+    }
+
+
+def dump_pyproject(config: ProjectConfig, fp: BinaryIO) -> None:
+    """
+    Stream pyproject.toml contents from config to a binary file object
+    """
+    import tomli_w
+
+    tomli_w.dump({"project": _build_project(config)}, fp)
+    fp.write(b"\n")
+    fp.write(_dump_static_tables(config.package_path))
+
+
+def _render_pyproject(config: ProjectConfig) -> bytes:
+    """
+    Serialize pyproject.toml contents from config
+    """
+    buffer = BytesIO()
+    dump_pyproject(config, buffer)
+
+    return buffer.getvalue()
+
+
+def _render_publish_workflow(project_name: str) -> bytes:
+    """
+    Fill the publish workflow template with the project name
+    """
+    return _PUB_PREFIX + project_name.encode("utf-8") + _PUB_SUFFIX
 
 
 def write_pyproject(config: ProjectConfig, output_dir: Path) -> Path:
     """
     Generate and write pyproject.toml file
     """
-    pyproject = build_pyproject(config)
     output_path = output_dir / "pyproject.toml"
-
-    with output_path.open("wb") as f:
-        tomli_w.dump(pyproject, f)
+    output_path.write_bytes(_render_pyproject(config))
 
     return output_path
 
@@ -231,14 +281,8 @@ def write_publish_workflow(project_name: str, output_dir: Path) -> Path:
     workflow_dir = output_dir / ".github" / "workflows"
     workflow_dir.mkdir(parents = True, exist_ok = True)
 
-    workflow_content = PUBLISH_WORKFLOW.replace(
-        "$PROJECT_NAME",
-        project_name
-    )
     output_path = workflow_dir / "publish.yml"
-
-    with output_path.open("w") as f:
-        f.write(workflow_content)
+    output_path.write_bytes(_render_publish_workflow(project_name))
 
     return output_path
 
@@ -248,8 +292,27 @@ def write_style_yapf(output_dir: Path) -> Path:
     Generate and write .style.yapf file
     """
     output_path = output_dir / ".style.yapf"
-
-    with output_path.open("w") as f:
-        f.write(STYLE_YAPF)
+    output_path.write_bytes(_STYLE_YAPF_BYTES)
 
     return output_path
+
+
+def write_all(
+    config: ProjectConfig,
+    output_dir: Path,
+    *,
+    add_workflow: bool,
+    add_yapf: bool,
+) -> list[Path]:
+    """
+    Generate and write every requested file in a single pass
+    """
+    created = [write_pyproject(config, output_dir)]
+
+    if add_workflow:
+        created.append(write_publish_workflow(config.name, output_dir))
+
+    if add_yapf:
+        created.append(write_style_yapf(output_dir))
+
+    return created
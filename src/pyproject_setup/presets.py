@@ -4,25 +4,22 @@ presets.py
 """
 
 from typing import Any
-from dataclasses import (
-    field,
-    dataclass,
-)
+from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots = True, frozen = True)
 class Preset:
     """
     Configuration preset for pyproject.toml generation
     """
     name: str
     description: str
-    dependencies: list[str] = field(default_factory = list)
-    dev_dependencies: list[str] = field(default_factory = list)
+    dependencies: tuple[str, ...] = ()
+    dev_dependencies: tuple[str, ...] = ()
     entry_point: str | None = None
 
 
-FASTAPI_DEPS = [
+FASTAPI_DEPS: tuple[str, ...] = (
     "fastapi-cli>=0.0.16,<0.1.0",
     "pydantic>=2.12.5,<3.0.0",
     "pydantic-settings>=2.12.0,<3.0.0",
@@ -39,9 +36,9 @@ FASTAPI_DEPS = [
     "structlog>=25.5.0,<26.0.0",
     "gunicorn>=23.0.0,<24.0.0",
     "uvicorn[standard]>=0.38.0,<0.39.0",
-]
+)
 
-FASTAPI_DEV_DEPS = [
+FASTAPI_DEV_DEPS: tuple[str, ...] = (
     "pytest>=9.0.2,<10.0.0",
     "pytest-asyncio>=1.3.0,<2.0.0",
     "pytest-cov>=7.0.0,<8.0.0",
@@ -56,9 +53,9 @@ FASTAPI_DEV_DEPS = [
     "pylint>=4.0.4,<5.0.0",
     "pylint-pydantic>=0.4.1,<0.5.0",
     "pylint-per-file-ignores>=3.2.0,<4.0.0",
-]
+)
 
-LIBRARY_DEV_DEPS = [
+LIBRARY_DEV_DEPS: tuple[str, ...] = (
     "pytest>=9.0.2,<10.0.0",
     "pytest-cov>=7.0.0,<8.0.0",
     "httpx>=0.28.1,<0.29.0",
@@ -67,14 +64,14 @@ LIBRARY_DEV_DEPS = [
     "ty>=0.0.1a32,<0.1.0",
     "pre-commit>=4.5.0,<5.0.0",
     "pylint>=4.0.4,<5.0.0",
-]
+)
 
-CLI_DEPS = [
+CLI_DEPS: tuple[str, ...] = (
     "typer>=0.20.0,<0.21.0",
     "rich>=14.2.0,<15.0.0",
-]
+)
 
-CLI_DEV_DEPS = [
+CLI_DEV_DEPS: tuple[str, ...] = (
     "pytest>=9.0.2,<10.0.0",
     "pytest-cov>=7.0.0,<8.0.0",
     "mypy>=1.19.0,<2.0.0",
@@ -82,7 +79,7 @@ CLI_DEV_DEPS = [
     "ty>=0.0.1a32,<0.1.0",
     "pre-commit>=4.5.0,<5.0.0",
     "pylint>=4.0.4,<5.0.0",
-]
+)
 
 PRESETS: dict[
     str,
@@ -98,7 +95,7 @@ PRESETS: dict[
         Preset(
             name = "library",
             description = "Python library (no runtime deps)",
-            dependencies = [],
+            dependencies = (),
             dev_dependencies = LIBRARY_DEV_DEPS,
         ),
         "cli-tool":
@@ -111,6 +108,52 @@ PRESETS: dict[
         ),
     }
 
+PRESET_CHOICES: tuple[str, ...] = tuple(PRESETS)
+
+PRESET_MENU_LINES: tuple[str, ...] = tuple(
+    f"  [cyan]{i}[/cyan]. {name} - {p.description}"
+    for i, (name, p) in enumerate(PRESETS.items(), 1)
+)
+
+
+_RUFF_LINT_SELECT: tuple[str, ...] = (
+    "E",
+    "W",
+    "F",
+    "B",
+    "C4",
+    "UP",
+    "ARG",
+    "SIM",
+    "PTH",
+    "RUF",
+    "ASYNC",
+    "S",
+    "N",
+)
+
+_RUFF_LINT_IGNORE: tuple[str, ...] = (
+    "E501",
+    "B008",
+    "S101",
+    "S104",
+    "S105",
+    "ARG001",
+    "E712",
+    "N999",
+    "N818",
+    "UP046",
+    "RUF005",
+)
+
+_RUFF_PER_FILE_IGNORES_STATIC: dict[str,
+                                    tuple[str,
+                                          ...]] = {
+                                              "tests/**/*.py": ("S101",
+                                                                "ARG001"),
+                                              "conftest.py": ("S107", ),
+                                          }
+
 
 def get_ruff_config(package_path: str) -> dict[str, Any]:
     """
@@ -122,38 +165,10 @@ def get_ruff_config(package_path: str) -> dict[str, Any]:
         "src": [package_path],
         "exclude": ["alembic"],
         "lint": {
-            "select": [
-                "E",
-                "W",
-                "F",
-                "B",
-                "C4",
-                "UP",
-                "ARG",
-                "SIM",
-                "PTH",
-                "RUF",
-                "ASYNC",
-                "S",
-                "N",
-            ],
-            "ignore": [
-                "E501",
-                "B008",
-                "S101",
-                "S104",
-                "S105",
-                "ARG001",
-                "E712",
-                "N999",
-                "N818",
-                "UP046",
-                "RUF005",
-            ],
+            "select": _RUFF_LINT_SELECT,
+            "ignore": _RUFF_LINT_IGNORE,
             "per-file-ignores": {
-                "tests/**/*.py": ["S101",
-                                  "ARG001"],
-                "conftest.py": ["S107"],
+                **_RUFF_PER_FILE_IGNORES_STATIC,
                 f"{package_path}/core/rate_limit.py": ["S110"],
                 f"{package_path}/config.py": ["F401"],
                 f"{package_path}/schemas/**/*.py": ["RUF012"],
@@ -162,47 +177,53 @@ def get_ruff_config(package_path: str) -> dict[str, Any]:
     }
 
 
+_MYPY_BASE: dict[str,
+                 Any] = {
+                     "python_version": "3.12",
+                     "strict": True,
+                     "warn_return_any": True,
+                     "warn_unused_ignores": True,
+                     "disallow_untyped_defs": True,
+                     "disallow_incomplete_defs": True,
+                     "plugins": ("pydantic.mypy", ),
+                     "exclude": ("alembic", ),
+                 }
+
+_MYPY_OVERRIDE_TESTS: dict[str,
+                           Any] = {
+                               "module": ("tests.*",
+                                          "conftest"),
+                               "ignore_errors": True
+                           }
+
+_MYPY_OVERRIDE_MISSING_IMPORTS: dict[str,
+                                     Any] = {
+                                         "module": (
+                                             "uuid6",
+                                             "structlog",
+                                             "structlog.*",
+                                             "pwdlib",
+                                             "slowapi",
+                                             "slowapi.*",
+                                         ),
+                                         "ignore_missing_imports":
+                                         True,
+                                     }
+
+
 def get_mypy_config(package_path: str) -> dict[str, Any]:
     """
     Return mypy configuration section.
     """
     return {
-        "python_version":
-        "3.12",
-        "strict":
-        True,
-        "warn_return_any":
-        True,
-        "warn_unused_ignores":
-        True,
-        "disallow_untyped_defs":
-        True,
-        "disallow_incomplete_defs":
-        True,
-        "plugins": ["pydantic.mypy"],
-        "exclude": ["alembic"],
+        **_MYPY_BASE,
         "overrides": [
-            {
-                "module": ["tests.*",
-                           "conftest"],
-                "ignore_errors": True
-            },
+            dict(_MYPY_OVERRIDE_TESTS),
             {
                 "module": [f"{package_path}.core.logging"],
                 "disable_error_code": ["no-any-return"]
             },
-            {
-                "module": [
-                    "uuid6",
-                    "structlog",
-                    "structlog.*",
-                    "pwdlib",
-                    "slowapi",
-                    "slowapi.*",
-                ],
-                "ignore_missing_imports":
-                True,
-            },
+            dict(_MYPY_OVERRIDE_MISSING_IMPORTS),
             {
                 "module": [f"{package_path}.config"],
                 "implicit_reexport": True
@@ -322,6 +343,13 @@ def get_pytest_config() -> dict[str, Any]:
     }
 
 
+_COVERAGE_EXCLUDE_LINES: tuple[str, ...] = (
+    "pragma: no cover",
+    "if TYPE_CHECKING:",
+    "raise NotImplementedError",
+)
+
+
 def get_coverage_config(package_path: str) -> dict[str, Any]:
     """
     Return coverage configuration sections.
@@ -332,15 +360,29 @@ def get_coverage_config(package_path: str) -> dict[str, Any]:
             "source": [package_path]
         },
         "report": {
-            "exclude_lines": [
-                "pragma: no cover",
-                "if TYPE_CHECKING:",
-                "raise NotImplementedError",
-            ],
+            "exclude_lines": _COVERAGE_EXCLUDE_LINES
         },
     }
 
 
+_TY_SRC_EXCLUDE: tuple[str, ...] = ("alembic/versions/**", ".venv/**")
+
+_TY_RULES: dict[str,
+                str] = {
+                    "possibly-missing-attribute": "error",
+                    "possibly-missing-import": "error",
+                    "unused-ignore-comment": "warn",
+                    "redundant-cast": "warn",
+                    "undefined-reveal": "warn",
+                }
+
+_TY_TERMINAL: dict[str,
+                   Any] = {
+                       "error-on-warning": False,
+                       "output-format": "full"
+                   }
+
+
 def get_ty_config(package_path: str) -> dict[str, Any]:
     """
     Return ty (type checker) configuration section.
@@ -349,8 +391,7 @@ def get_ty_config(package_path: str) -> dict[str, Any]:
         "src": {
             "include": [package_path,
                         "tests"],
-            "exclude": ["alembic/versions/**",
-                        ".venv/**"],
+            "exclude": _TY_SRC_EXCLUDE,
             "respect-ignore-files": True,
         },
         "environment": {
@@ -358,13 +399,7 @@ def get_ty_config(package_path: str) -> dict[str, Any]:
             "root": [f"./{package_path}"],
             "python": "./.venv",
         },
-        "rules": {
-            "possibly-missing-attribute": "error",
-            "possibly-missing-import": "error",
-            "unused-ignore-comment": "warn",
-            "redundant-cast": "warn",
-            "undefined-reveal": "warn",
-        },
+        "rules": dict(_TY_RULES),
         "overrides": [
             {
                 "include": ["tests/**"],
@@ -383,10 +418,7 @@ def get_ty_config(package_path: str) -> dict[str, Any]:
                 },
             },
         ],
-        "terminal": {
-            "error-on-warning": False,
-            "output-format": "full"
-        },
+        "terminal": dict(_TY_TERMINAL),
     }
 
 